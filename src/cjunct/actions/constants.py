@@ -6,11 +6,13 @@ __all__ = [
     "ACTION_RESERVED_FIELD_NAMES",
 ]
 
-ACTION_RESERVED_FIELD_NAMES: t.Set[str] = {
-    "name",
-    "type",
-    "description",
-    "expects",
-    "selectable",
-    "severity",
-}
+ACTION_RESERVED_FIELD_NAMES: t.FrozenSet[str] = frozenset(
+    {
+        "name",
+        "type",
+        "description",
+        "expects",
+        "selectable",
+        "severity",
+    }
+)
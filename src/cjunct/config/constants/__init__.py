@@ -85,6 +85,7 @@ class C:
         lambda: Path().resolve() / ".env",
     )
     CONTEXT_DIRECTORY: Mandatory[Path] = Mandatory(
+        lambda: maybe_path(Env.CJUNCT_CONTEXT_DIRECTORY),
         lambda: Path().resolve(),
     )
     INTERACTIVE_MODE: Mandatory[bool] = Mandatory(
@@ -1,5 +1,6 @@
 """Lazy-loaded constants helpers"""
 
+import functools
 import hashlib
 import os
 import sys
@@ -50,6 +51,27 @@ def load_external_module(source: Path, submodule_name: t.Optional[str] = None) -
     if submodule_name is None:
         submodule_name = hashlib.md5(str(source).encode()).hexdigest()  # nosec  # pragma: no cover
     module_name: str = f"{EXTERNALS_MODULES_PACKAGE}.{submodule_name}"
+    source_stat: os.stat_result = source.stat()
+    module: ModuleType = _load_external_module_version(
+        source=source.resolve(),
+        mtime_ns=source_stat.st_mtime_ns,
+        size=source_stat.st_size,
+        module_name=module_name,
+        sys_paths=tuple(Env.CJUNCT_EXTERNAL_MODULES_PATHS),
+    )
+    sys.modules[module_name] = module
+    return module
+
+
+@functools.lru_cache(maxsize=64)
+def _load_external_module_version(
+    source: Path,
+    mtime_ns: int,  # pylint: disable=unused-argument
+    size: int,  # pylint: disable=unused-argument
+    module_name: str,
+    sys_paths: t.Tuple[str, ...],
+) -> ModuleType:
+    """Execute an external module once per file version, module name and extra import paths"""
     module_spec: t.Optional[ModuleSpec] = spec_from_file_location(
         name=module_name,
         location=source,
@@ -57,9 +79,8 @@ def load_external_module(source: Path, submodule_name: t.Optional[str] = None) -
     if module_spec is None:
         raise SourceError(f"Can't read module spec from source: {source}")
     module: ModuleType = module_from_spec(module_spec)
-    with add_sys_paths(*Env.CJUNCT_EXTERNAL_MODULES_PATHS):
+    with add_sys_paths(*sys_paths):
         module_spec.loader.exec_module(module)  # type: ignore
-    sys.modules[module_name] = module
     return module
 
 
@@ -28,7 +28,10 @@ class Env(EnvironmentNamespace):
         Default is .env in the current directory.
     CJUNCT_WORKFLOW_FILE:
         Workflow file to use.
-        Default behaviour is scan the current working directory.
+        Default behaviour is scan the context directory.
+    CJUNCT_CONTEXT_DIRECTORY:
+        Directory to scan for workflow files when no workflow file is given.
+        Default is the current working directory.
     CJUNCT_WORKFLOW_LOADER_SOURCE_FILE:
         May point a file containing a WorkflowLoader class definition, which will replace the default implementation.
     CJUNCT_DISPLAY_SOURCE_FILE:
@@ -57,6 +60,7 @@ class Env(EnvironmentNamespace):
     CJUNCT_LOG_FILE: str = OptionalString("")
     CJUNCT_ENV_FILE: str = OptionalString("")
     CJUNCT_WORKFLOW_FILE: str = OptionalString("")
+    CJUNCT_CONTEXT_DIRECTORY: str = OptionalString("")
     CJUNCT_WORKFLOW_LOADER_SOURCE_FILE: str = OptionalString("")
     CJUNCT_DISPLAY_SOURCE_FILE: str = OptionalString("")
     CJUNCT_STRATEGY_NAME: str = OptionalString("")
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import copy
 import typing as t
 from functools import lru_cache
 from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML is built with it: it is the same safe loader, only much faster
+try:
+    from yaml import CSafeLoader as _BaseSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _BaseSafeLoader  # type: ignore
+
 from .base import AbstractBaseWorkflowLoader
 from ..actions.base import ActionBase
 from ..actions.bundled import (
@@ -25,7 +32,7 @@ __all__ = [
 ]
 
 
-class YAMLLoader(yaml.SafeLoader):
+class YAMLLoader(_BaseSafeLoader):
     """Extension loader"""
 
     @classmethod
@@ -44,6 +51,12 @@ YAMLLoader.add_string_constructor("!@", ObjectTemplate)
 YAMLLoader.add_string_constructor("!import", Import)
 
 
+@lru_cache(maxsize=256)
+def _parse_yaml(data: t.Union[str, bytes]) -> t.Any:
+    """Parse YAML data once per distinct content"""
+    return yaml.load(data, YAMLLoader)  # nosec
+
+
 class DefaultYAMLWorkflowLoader(AbstractBaseWorkflowLoader):
     """Default loader for YAML source files"""
 
@@ -108,9 +121,9 @@ class DefaultYAMLWorkflowLoader(AbstractBaseWorkflowLoader):
         data: t.Union[str, bytes],
         allowed_root_keys: t.Set[str],
     ) -> None:
-        if isinstance(data, bytes):
-            data = data.decode()
-        root_node: dict = yaml.load(data, YAMLLoader)  # nosec
+        # PyYAML detects the encoding of raw bytes itself, so there is no need to decode them in advance.
+        # Parsed trees are shared between loads of the same content, so each load processes its own copy.
+        root_node: dict = copy.deepcopy(_parse_yaml(data))
         if not isinstance(root_node, dict):
             self._throw(f"Unknown workflow structure: {type(root_node)!r} (should be a dict)")
         root_keys: t.Set[str] = set(root_node)
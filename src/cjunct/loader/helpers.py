@@ -1,17 +1,24 @@
 """Common loader utilities"""
 
 import io
+import sys
 import typing as t
 from pathlib import Path
 
+import classlogging
+
 from .base import AbstractBaseWorkflowLoader
 from .default import DefaultYAMLWorkflowLoader
+from ..config.constants import C
 from ..exceptions import SourceError
 
 __all__ = [
     "get_default_loader_class_for_source",
+    "detect_workflow_source",
 ]
 
+logger = classlogging.get_module_logger()
+
 STREAM_DEFAULT_LOADER: t.Type[AbstractBaseWorkflowLoader] = DefaultYAMLWorkflowLoader
 SUFFIX_TO_LOADER_MAP: t.Dict[str, t.Type[AbstractBaseWorkflowLoader]] = {
     ".yml": DefaultYAMLWorkflowLoader,
@@ -29,3 +36,37 @@ def get_default_loader_class_for_source(
     if (loader_class := SUFFIX_TO_LOADER_MAP.get(source_path.suffix)) is None:
         raise SourceError(f"Unrecognized source: {source_path}")
     return loader_class
+
+
+def detect_workflow_source(
+    explicit_source: t.Union[str, Path, io.TextIOBase, None] = None,
+) -> t.Union[Path, io.TextIOBase]:
+    """Choose the workflow source: explicit one, configured file/stdin or a file detected in the context directory"""
+    if explicit_source is not None:
+        if isinstance(explicit_source, io.TextIOBase):
+            return explicit_source
+        return Path(explicit_source)
+    if C.ACTIONS_SOURCE_FILE is not None:
+        source_file: Path = C.ACTIONS_SOURCE_FILE
+        if str(source_file) == "-":
+            logger.info("Using stdin as workflow source")
+            return t.cast(io.TextIOBase, sys.stdin)
+        if not source_file.exists():
+            raise SourceError(f"Given workflow file does not exist: {source_file}")
+        logger.info(f"Using given workflow file: {source_file}")
+        return source_file
+    scan_path: Path = C.CONTEXT_DIRECTORY
+    logger.debug(f"Looking for workflow files at {str(scan_path)!r}")
+    located_source_file: t.Optional[Path] = None
+    for candidate_file_name in (
+        "cjunct.yml",
+        "cjunct.yaml",
+    ):  # type: str
+        if (maybe_source_file := scan_path / candidate_file_name).exists():
+            logger.info(f"Detected the workflow source: {str(maybe_source_file)!r}")
+            if located_source_file is not None:
+                raise SourceError(f"Multiple workflow sources detected in {scan_path}")
+            located_source_file = maybe_source_file
+    if located_source_file is None:
+        raise SourceError(f"No workflow source detected in {scan_path}")
+    return located_source_file
@@ -1,7 +1,9 @@
 """All the templating stuff."""
 
+import functools
 import os
 import typing as t
+from types import CodeType
 
 from classlogging import LoggerMixin
 
@@ -17,6 +19,20 @@ __all__ = [
     "Templar",
 ]
 
+LexemesType = t.Tuple[t.Tuple[int, str], ...]
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_template(value: str) -> LexemesType:
+    # Lexing is far more expensive than evaluation, while the same templates are rendered over and over again
+    return tuple(TemplarStringLexer(value).tokens())
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> CodeType:
+    # Same as what eval() does with a source string, except that the code object is reused by subsequent calls
+    return compile(expression.lstrip(" \t"), "<string>", "eval")
+
 
 class Templar(LoggerMixin):
     """Expression renderer"""
@@ -49,9 +65,8 @@ class Templar(LoggerMixin):
             "ctx": context_container,
             "env": environment_container,
         }
-        self._globals: t.Dict[str, t.Any] = {
-            f: self._make_restricted_builtin_call_shim(f) for f in self.DISABLED_GLOBALS
-        }
+        # Expressions are able to write to their globals, so never share the cached dict itself
+        self._globals: t.Dict[str, t.Any] = dict(self._get_restricted_globals())
         self._depth: int = 0
 
     def render(self, value: str) -> str:
@@ -68,16 +83,16 @@ class Templar(LoggerMixin):
 
     def _internal_render(self, value: str) -> str:
         """Recursive rendering routine"""
+        # Cheap check: pure literals need neither lexing nor depth tracking
+        if not qualify_string_as_potentially_renderable(value):
+            return value
         self._depth += 1
         if self._depth >= MAX_RECURSION_DEPTH:
             # This exception floats to the very "render" call without any logging
             raise ActionRenderRecursionError(f"Recursion depth exceeded: {self._depth}/{MAX_RECURSION_DEPTH}")
         try:
             chunks: t.List[str] = []
-            # Cheap check
-            if not qualify_string_as_potentially_renderable(value):
-                return value
-            for lexeme_type, lexeme_value in TemplarStringLexer(value):
+            for lexeme_type, lexeme_value in _split_template(value):
                 if lexeme_type == TemplarStringLexer.EXPRESSION:
                     lexeme_value = str(self._eval(expression=lexeme_value))
                 chunks.append(lexeme_value)
@@ -85,6 +100,12 @@ class Templar(LoggerMixin):
         finally:
             self._depth -= 1
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)  # pylint: disable=method-cache-max-size-none
+    def _get_restricted_globals(cls) -> t.Dict[str, t.Any]:
+        """Shims do not depend on the workflow state, so they are built once per class"""
+        return {f: cls._make_restricted_builtin_call_shim(f) for f in cls.DISABLED_GLOBALS}
+
     @classmethod
     def _make_restricted_builtin_call_shim(cls, name: str) -> t.Callable:
         def _call(*args, **kwargs) -> t.NoReturn:
@@ -97,7 +118,7 @@ class Templar(LoggerMixin):
         self.logger.trace(f"Processing expression: {expression!r}")
         try:
             # pylint: disable=eval-used
-            return eval(expression, self._globals, self._locals)  # nosec
+            return eval(_compile_expression(expression), self._globals, self._locals)  # nosec
         except ActionRenderError:
             raise
         except Exception as e:
@@ -64,38 +64,39 @@ class TemplarStringLexer:
 
     def __init__(self, data: str) -> None:
         self._data: str = data
-        self._len: int = len(data)
         self._caret: int = 0
 
-    def _get_symbol(self) -> str:
-        """Read the next symbol of the input data"""
-        if self._caret >= self._len:
-            raise EOFError
-        self._caret += 1
-        return self._data[self._caret - 1]
-
     def __iter__(self) -> t.Iterator[t.Tuple[int, str]]:
-        """Alternately yield raw text to leave as is and expressions to evaluate"""
-        armed_at: bool = False
+        return iter(self.tokens())
+
+    def tokens(self) -> t.List[t.Tuple[int, str]]:
+        """Collect alternating raw text to leave as is and expressions to evaluate"""
+        data: str = self._data
+        result: t.List[t.Tuple[int, str]] = []
         text_start: int = self._caret
-        while True:
+        search_start: int = self._caret
+        # Literal spans are skipped in bulk: only "@{" pairs are worth a closer look
+        while (at_position := data.find("@{", search_start)) != -1:
+            # Each expression starts with an "@{" pair, which can be escaped by doubling the "@" down,
+            # thus only an odd-length run of "@" engages the expression scanning
+            at_run_start: int = at_position
+            while at_run_start > search_start and data[at_run_start - 1] == "@":
+                at_run_start -= 1
+            self._caret = search_start = at_position + 2
+            if (at_position - at_run_start) % 2:
+                continue
             try:
-                # Each expression starts with an "@{" pair, which can be escaped by doubling the "@" down,
-                # thus each second "@" disengages the expression scanning readiness
-                if (symbol := self._get_symbol()) == "@":
-                    armed_at = not armed_at
-                    continue
-                if symbol == "{" and armed_at:
-                    if maybe_text := self._data[text_start : self._caret - 2]:  # -2 stands for the "@{"
-                        yield self.TEXT, maybe_text
-                    expression_source_length, expression = self._read_expression()
-                    yield self.EXPRESSION, expression
-                    text_start = self._caret + expression_source_length + 1  # Start again right after the closing brace
-                armed_at = False
-            except (StopIteration, EOFError):
-                if maybe_text := self._data[text_start:]:
-                    yield self.TEXT, maybe_text
+                expression_source_length, expression = self._read_expression()
+            except StopIteration:
+                # Unterminated expression: leave the rest as is
                 break
+            if at_position > text_start:
+                result.append((self.TEXT, data[text_start:at_position]))
+            result.append((self.EXPRESSION, expression))
+            text_start = search_start = self._caret + expression_source_length + 1  # Right after the closing brace
+        if maybe_text := data[text_start:]:
+            result.append((self.TEXT, maybe_text))
+        return result
 
     def _read_expression(self) -> t.Tuple[int, str]:
         """Use a tokenizer to detect the closing brace"""
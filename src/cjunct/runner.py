@@ -6,7 +6,6 @@ thus placed to a separate module.
 import asyncio
 import functools
 import io
-import sys
 import typing as t
 from enum import Enum
 from pathlib import Path
@@ -18,8 +17,8 @@ from . import types
 from .actions.base import ActionBase, ArgsBase, ActionStatus
 from .config.constants import C
 from .display.base import BaseDisplay
-from .exceptions import SourceError, ExecutionFailed, ActionRenderError, ActionRunError
-from .loader.helpers import get_default_loader_class_for_source
+from .exceptions import ExecutionFailed, ActionRenderError, ActionRunError
+from .loader.helpers import get_default_loader_class_for_source, detect_workflow_source
 from .rendering import Templar
 from .tools.concealment import represent_object_type
 from .workflow import Workflow
@@ -39,9 +38,11 @@ class Runner(classlogging.LoggerMixin):
         self,
         source: t.Union[str, Path, IOType, None] = None,
         display: t.Optional[types.DisplayType] = None,
+        strategy_class: t.Optional[types.StrategyClassType] = None,
     ) -> None:
-        self._workflow_source: t.Union[Path, IOType] = self._detect_workflow_source(explicit_source=source)
+        self._workflow_source: t.Union[Path, IOType] = detect_workflow_source(explicit_source=source)
         self._explicit_display: t.Optional[types.DisplayType] = display
+        self._explicit_strategy_class: t.Optional[types.StrategyClassType] = strategy_class
         self._started: bool = False
         self._outcomes: t.Dict[str, t.Dict[str, t.Any]] = {}
         self._execution_failed: bool = False
@@ -79,41 +80,12 @@ class Runner(classlogging.LoggerMixin):
     @functools.cached_property
     def strategy(self) -> types.StrategyType:
         """Strategy iterator"""
-        strategy_class: types.StrategyClassType = C.STRATEGY_CLASS
+        strategy_class: types.StrategyClassType = (
+            C.STRATEGY_CLASS if self._explicit_strategy_class is None else self._explicit_strategy_class
+        )
         self.logger.debug(f"Using strategy class: {strategy_class}")
         return strategy_class(workflow=self.workflow)
 
-    @classmethod
-    def _detect_workflow_source(cls, explicit_source: t.Union[str, Path, IOType, None] = None) -> t.Union[Path, IOType]:
-        if explicit_source is not None:
-            if isinstance(explicit_source, IOType):
-                return explicit_source
-            return Path(explicit_source)
-        if C.ACTIONS_SOURCE_FILE is not None:
-            source_file: Path = C.ACTIONS_SOURCE_FILE
-            if str(source_file) == "-":
-                cls.logger.info("Using stdin as workflow source")
-                return t.cast(IOType, sys.stdin)
-            if not source_file.exists():
-                raise SourceError(f"Given workflow file does not exist: {source_file}")
-            cls.logger.info(f"Using given workflow file: {source_file}")
-            return source_file
-        scan_path: Path = C.CONTEXT_DIRECTORY
-        cls.logger.debug(f"Looking for workflow files at {str(scan_path)!r}")
-        located_source_file: t.Optional[Path] = None
-        for candidate_file_name in (
-            "cjunct.yml",
-            "cjunct.yaml",
-        ):  # type: str
-            if (maybe_source_file := scan_path / candidate_file_name).exists():
-                cls.logger.info(f"Detected the workflow source: {str(maybe_source_file)!r}")
-                if located_source_file is not None:
-                    raise SourceError(f"Multiple workflow sources detected in {scan_path}")
-                located_source_file = maybe_source_file
-        if located_source_file is None:
-            raise SourceError(f"No workflow source detected in {scan_path}")
-        return located_source_file
-
     async def run_async(self) -> None:
         """Primary coroutine for all further processing"""
         try:
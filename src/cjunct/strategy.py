@@ -6,6 +6,7 @@ emitting actions one by one for further scheduling.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import typing as t
 
 import classlogging
@@ -105,24 +106,42 @@ class LooseStrategy(BaseStrategy):
         self._active_actions_map: t.Dict[str, ActionBase] = {}
         # Just a structured mutable copy of the dependency map
         self._action_blockers: t.Dict[str, t.Set[str]] = {name: set(workflow[name].ancestors) for name in workflow}
+        # Emission order among simultaneously ready actions follows the workflow order
+        self._action_order: t.Dict[str, int] = {name: num for num, name in enumerate(workflow)}
+        # Heap of (order, name) pairs of actions with no blockers left
+        self._ready_actions_heap: t.List[t.Tuple[int, str]] = [
+            (self._action_order[name], name) for name, blockers in self._action_blockers.items() if not blockers
+        ]
+        heapq.heapify(self._ready_actions_heap)
+        # Account for the actions that are done beforehand, e.g. disabled during interaction
+        for action in workflow.values():
+            if action.done():
+                self._release_descendants(action)
 
     def _skip_action(self, action: ActionBase) -> None:
         super()._skip_action(action)
         self._active_actions_map.pop(action.name, None)
+        self._release_descendants(action)
+
+    def _release_descendants(self, action: ActionBase) -> None:
+        """Unblock direct descendants of a finished action, queueing those having no blockers left"""
+        for descendant_name in self._workflow.get_descendants_names(action.name):
+            descendant_blockers: t.Optional[t.Set[str]] = self._action_blockers.get(descendant_name)
+            if descendant_blockers is None or action.name not in descendant_blockers:
+                continue
+            descendant_blockers.remove(action.name)
+            if not descendant_blockers:
+                heapq.heappush(self._ready_actions_heap, (self._action_order[descendant_name], descendant_name))
 
     def _get_maybe_next_action(self) -> t.Optional[ActionBase]:
-        """Completely non-optimal (always scan all actions), but readable yet"""
-        done_action_names: t.Set[str] = {action.name for action in self._workflow.values() if action.done()}
-        # Copy into a list for further possible pop
-        for maybe_next_action_name, maybe_next_action_blockers in list(self._action_blockers.items()):
-            maybe_next_action_blockers -= done_action_names
-            if not maybe_next_action_blockers:
-                self.logger.debug(f"Action {maybe_next_action_name!r} is ready for scheduling")
-                self._action_blockers.pop(maybe_next_action_name)
-                next_action: ActionBase = self._workflow[maybe_next_action_name]
-                self._active_actions_map[next_action.name] = next_action
-                return next_action
-        return None
+        if not self._ready_actions_heap:
+            return None
+        _, next_action_name = heapq.heappop(self._ready_actions_heap)
+        self.logger.debug(f"Action {next_action_name!r} is ready for scheduling")
+        self._action_blockers.pop(next_action_name)
+        next_action: ActionBase = self._workflow[next_action_name]
+        self._active_actions_map[next_action.name] = next_action
+        return next_action
 
     async def __anext__(self) -> ActionBase:
         while True:
@@ -155,6 +174,7 @@ class LooseStrategy(BaseStrategy):
                 if action.done():
                     self.logger.debug(f"Action {action.name!r} execution finished")
                     del self._active_actions_map[action.name]
+                    self._release_descendants(action)
             # Maybe now?
             if maybe_next_action := self._get_maybe_next_action():
                 return maybe_next_action
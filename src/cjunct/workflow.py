@@ -88,6 +88,10 @@ class Workflow(t.Dict[str, ActionBase], LoggerMixin):
             action_tier: int = action_name_to_tier_mapping[action_name]
             self._tiers_sequence[action_tier].append(action)
 
+    def get_descendants_names(self, action_name: str) -> t.KeysView[str]:
+        """Names of actions directly depending on the given one"""
+        return self._descendants_map.get(action_name, {}).keys()
+
     def iter_actions_by_tier(self) -> t.Generator[t.Tuple[int, ActionBase], None, None]:
         """Yield actions tier by tier"""
         for tier_num, tier_actions in enumerate(self._tiers_sequence):
@@ -1,14 +1,20 @@
 """CLI components tests fixtures"""
 
+import contextlib
+import io
+import sys
 import typing as t
-from contextlib import contextmanager
 
+import classlogging
 import pytest
 
+from cjunct import console
+from cjunct.config.constants import cli
 from cjunct.config.constants.cli import _CLI_PARAMS
+from .types import DirectInvokeType
 
 
-@contextmanager
+@contextlib.contextmanager
 def _cli_arg(name: str, value: str) -> t.Generator[None, None, None]:
     """Temporarily set CLI argument"""
     sentinel = object()
@@ -25,3 +31,21 @@ def invalid_strategy_cli_arg() -> t.Generator[None, None, None]:
     """Set invalid strategy CLI arg"""
     with _cli_arg(name="strategy", value="unknown-strategy"):
         yield
+
+
+@pytest.fixture
+def direct_invoke(monkeypatch: pytest.MonkeyPatch) -> DirectInvokeType:
+    """Call the CLI entrypoint in-process, bypassing click's isolation machinery"""
+    # Do not let parsed arguments leak into other tests
+    monkeypatch.setattr(cli, "_CLI_PARAMS", {})
+    # Keep the session logging configuration untouched
+    monkeypatch.setattr(classlogging, "configure_logging", lambda **_: None)
+
+    def invoke(args: t.List[str], stdin: t.Optional[str] = None) -> str:
+        if stdin is not None:
+            monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            console.main.main(args=args, standalone_mode=False, prog_name="cjunct")
+        return stdout.getvalue()
+
+    return invoke
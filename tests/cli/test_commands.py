@@ -0,0 +1,30 @@
+"""Test CLI commands"""
+
+import cjunct
+from cjunct.config.environment import Env
+from .types import DirectInvokeType
+
+
+def test_cli_version(direct_invoke: DirectInvokeType) -> None:
+    """Check version output"""
+    assert direct_invoke(["info", "version"]) == f"{cjunct.__version__}\n"
+
+
+def test_cli_env_vars(direct_invoke: DirectInvokeType) -> None:
+    """Check environment variables description output"""
+    assert direct_invoke(["info", "env-vars"]) == f"{Env.__doc__}\n"
+
+
+def test_cli_validate_stdin(direct_invoke: DirectInvokeType) -> None:
+    """Check workflow validation from the standard input"""
+    output: str = direct_invoke(
+        ["validate", "-"],
+        stdin="""---
+actions:
+  - name: Foo
+    type: echo
+    message: foo
+""",
+    )
+    # A valid workflow passes silently, any problem would exit with an error code instead
+    assert output == ""
@@ -0,0 +1,9 @@
+"""Types for CLI tests."""
+
+import typing as t
+
+__all__ = [
+    "DirectInvokeType",
+]
+
+DirectInvokeType = t.Callable[..., str]
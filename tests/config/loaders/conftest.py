@@ -8,31 +8,23 @@ import pytest
 from _pytest.fixtures import SubRequest
 
 from cjunct import exceptions
+from .types import SampleType
 
 # Prepare regex patterns for exception pragma search
 PRAGMA_MATCHER_TEMPLATES_MAP: t.Dict[str, str] = {
     ".yaml": r"^\s*#\s*{}:\s*(.*)$",
 }
-# Get all sample files list
-SAMPLES_DIR: Path = Path(__file__).parent / "samples"
-SAMPLES: t.List[Path] = [
-    item for item in SAMPLES_DIR.iterdir() if item.is_file() and item.suffix in PRAGMA_MATCHER_TEMPLATES_MAP
-]
+PRAGMA_PATTERNS_MAP: t.Dict[str, t.Tuple[t.Pattern, t.Pattern]] = {
+    suffix: (re.compile(template.format("exception")), re.compile(template.format("match")))
+    for suffix, template in PRAGMA_MATCHER_TEMPLATES_MAP.items()
+}
 
 
-@pytest.fixture(params=SAMPLES, ids=[item.stem for item in SAMPLES])
-def sample_workflow(
-    request: SubRequest,
-    monkeypatch: pytest.MonkeyPatch,
-) -> t.Tuple[Path, t.Optional[t.Type[Exception]], t.Optional[str]]:
-    """Return sample workflow file path with (maybe) exception handling instructions"""
-    file_path: Path = request.param
-    # Find exception instructions
+def _scan_sample(file_path: Path) -> SampleType:
+    """Find exception instructions"""
     expected_exception_type: t.Optional[t.Type[Exception]] = None
     expected_exception_match: t.Optional[str] = None
-    template: str = PRAGMA_MATCHER_TEMPLATES_MAP[file_path.suffix]
-    pragma_exception_type_pattern: t.Pattern = re.compile(template.format("exception"))
-    pragma_exception_match_pattern: t.Pattern = re.compile(template.format("match"))
+    pragma_exception_type_pattern, pragma_exception_match_pattern = PRAGMA_PATTERNS_MAP[file_path.suffix]
     with file_path.open(encoding="utf-8") as f:
         for line in f:
             for match in pragma_exception_type_pattern.finditer(line):
@@ -41,5 +33,19 @@ def sample_workflow(
             for match in pragma_exception_match_pattern.finditer(line):
                 expected_exception_match = match.group(1)
                 break
-    monkeypatch.chdir(file_path.parent)
     return file_path, expected_exception_type, expected_exception_match
+
+
+# Get all sample files list, scanned once per session
+SAMPLES_DIR: Path = Path(__file__).parent / "samples"
+SAMPLES: t.List[SampleType] = [
+    _scan_sample(item)
+    for item in SAMPLES_DIR.iterdir()
+    if item.is_file() and item.suffix in PRAGMA_MATCHER_TEMPLATES_MAP
+]
+
+
+@pytest.fixture(params=SAMPLES, ids=[item[0].stem for item in SAMPLES])
+def sample_workflow(request: SubRequest) -> SampleType:
+    """Return sample workflow file path with (maybe) exception handling instructions"""
+    return request.param
@@ -1,7 +1,6 @@
 """Workflow loaders public methods tests"""
 
 import typing as t
-from pathlib import Path
 
 import pytest
 
@@ -9,11 +8,10 @@ from cjunct.exceptions import LoadError
 from cjunct.loader.base import AbstractBaseWorkflowLoader
 from cjunct.loader.default import DefaultYAMLWorkflowLoader
 from cjunct.loader.helpers import get_default_loader_class_for_source
+from .types import SampleType
 
 
-def test_workflow_load_over_sample(
-    sample_workflow: t.Tuple[Path, t.Optional[t.Type[Exception]], t.Optional[str]]
-) -> None:
+def test_workflow_load_over_sample(sample_workflow: SampleType) -> None:
     """Check different variations of good/bad workflows"""
     workflow_path, maybe_exception, maybe_match = sample_workflow
     loader_class: t.Type[AbstractBaseWorkflowLoader] = get_default_loader_class_for_source(workflow_path)
@@ -48,3 +46,21 @@ actions:
   - {}
 """
         )
+
+
+def test_yaml_loads_same_content_twice() -> None:
+    """Parsed data is shared between loads of the same content, so each load must be independent"""
+    data: bytes = b"""---
+context:
+  foo:
+    - bar
+actions:
+  - name: Foo
+    type: echo
+    message: "@{context.foo[0]}"
+"""
+    first_workflow = DefaultYAMLWorkflowLoader().loads(data)
+    second_workflow = DefaultYAMLWorkflowLoader().loads(data)
+    assert first_workflow["Foo"] is not second_workflow["Foo"]
+    assert first_workflow.context == second_workflow.context == {"foo": ["bar"]}
+    assert first_workflow.context["foo"] is not second_workflow.context["foo"]
@@ -0,0 +1,10 @@
+"""Types for loader tests."""
+
+import typing as t
+from pathlib import Path
+
+__all__ = [
+    "SampleType",
+]
+
+SampleType = t.Tuple[Path, t.Optional[t.Type[Exception]], t.Optional[str]]
@@ -1,8 +1,13 @@
 """Check constants engine"""
 
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
 import pytest
 
-from cjunct.config.constants.helpers import Mandatory
+from cjunct.config.constants.helpers import EXTERNALS_MODULES_PACKAGE, Mandatory, load_external_module
 
 
 def test_mandatory_failure():
@@ -14,3 +19,20 @@ def test_mandatory_failure():
 
     with pytest.raises(ValueError, match="getters failed"):
         assert C.FAILED
+
+
+def test_external_module_reload_on_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Validate external modules are executed once per file version"""
+    # Register the name with monkeypatch beforehand, so that teardown drops the module the loads below put there
+    monkeypatch.setitem(sys.modules, f"{EXTERNALS_MODULES_PACKAGE}.test_constants.module", None)  # type: ignore
+    source: Path = tmp_path / "module.py"
+    source.write_text("VALUE = 1\n")
+    first_module: ModuleType = load_external_module(source, "test_constants.module")
+    assert load_external_module(source, "test_constants.module") is first_module
+    # Keep the size the same, so that the change is detected by the modification time only
+    source.write_text("VALUE = 2\n")
+    source_mtime_ns: int = source.stat().st_mtime_ns + 1_000_000_000
+    os.utime(source, ns=(source_mtime_ns, source_mtime_ns))
+    second_module: ModuleType = load_external_module(source, "test_constants.module")
+    assert second_module is not first_module
+    assert second_module.VALUE == 2  # type: ignore
@@ -8,9 +8,11 @@ import pytest
 from cjunct.config.environment import Env
 from cjunct.tools.inspect import get_class_annotations
 
+# Scan the documentation once for all variables
+DOCS_LINES: t.Set[str] = set(textwrap.dedent(Env.__doc__).splitlines())  # type: ignore
+
 
 @pytest.mark.parametrize("variable_name", list(get_class_annotations(Env)))
 def test_env(variable_name: str) -> None:
     """Test that all vars are described in doc"""
-    docs_lines: t.List[str] = textwrap.dedent(Env.__doc__).splitlines()  # type: ignore
-    assert f"{variable_name}:" in docs_lines, f"Variable {variable_name!r} is not documented"
+    assert f"{variable_name}:" in DOCS_LINES, f"Variable {variable_name!r} is not documented"
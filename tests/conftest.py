@@ -15,6 +15,7 @@ def pytest_sessionstart():
 
 
 @pytest.fixture(autouse=True, scope="session")
-def configure_logging() -> None:
-    """Establish logging configuration"""
-    classlogging.configure_logging(level=classlogging.LogLevel.DEBUG)
+def configure_logging(pytestconfig: pytest.Config) -> None:
+    """Establish logging configuration.
+    Defaults to the WARNING level; use `-o log_level=DEBUG` to get verbose logs back."""
+    classlogging.configure_logging(level=pytestconfig.getini("log_level") or classlogging.LogLevel.WARNING)
@@ -1,6 +1,7 @@
 """Templar tests"""
 
 import re
+import typing as t
 
 import pytest
 
@@ -86,6 +87,13 @@ def test_restricted_setattr(templar: Templar) -> None:
         templar.render("@{setattr(status, 'Foo', 'SUCCESS')}")
 
 
+def test_globals_isolation(templar_factory: t.Callable[[], Templar]) -> None:
+    """Test names assigned by an expression do not leak to other templars"""
+    assert templar_factory().render("@{[leaked := 5 for _ in [1]]}") == "[5]"
+    with pytest.raises(ActionRenderError, match="name 'leaked' is not defined"):
+        templar_factory().render("@{leaked}")
+
+
 def test_complex_rendering(templar: Templar) -> None:
     """Test complex expression rendering"""
     assert (
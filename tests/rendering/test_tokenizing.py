@@ -12,7 +12,7 @@ class LexerTestCase(t.TypedDict):
     """Lexer test case variables"""
 
     source: str
-    result: t.List[t.Tuple[int, str]]
+    result: t.Tuple[t.Tuple[int, str], ...]
 
 
 class LexerDataSuite(DataSuite):
@@ -20,42 +20,54 @@ class LexerDataSuite(DataSuite):
 
     plain = LexerTestCase(
         source="foobar",
-        result=[(0, "foobar")],
+        result=((0, "foobar"),),
     )
     clean_expression = LexerTestCase(
         source="@{ a.b.c }",
-        result=[(1, "a .b .c ")],
+        result=((1, "a .b .c "),),
     )
     multiple_expressions = LexerTestCase(
         source="@{ a.b.c } @{ a.b.c }",
-        result=[(1, "a .b .c "), (0, " "), (1, "a .b .c ")],
+        result=((1, "a .b .c "), (0, " "), (1, "a .b .c ")),
     )
     complex_expression = LexerTestCase(
         source="""Hello, @{ {"foo": "world"}["foo"] }!""",
-        result=[(0, "Hello, "), (1, '{"foo":"world"}["foo"]'), (0, "!")],
+        result=((0, "Hello, "), (1, '{"foo":"world"}["foo"]'), (0, "!")),
     )
     expression_with_a_newline = LexerTestCase(
         source="@{a.b.c + \n a.b.d}",
-        result=[(1, "a .b .c +a .b .d ")],
+        result=((1, "a .b .c +a .b .d "),),
     )
     shlex_expression = LexerTestCase(
         source='@{ x."y z".w }',
-        result=[(1, 'x ."y z".w ')],
+        result=((1, 'x ."y z".w '),),
     )
     dashes_expression = LexerTestCase(
         source="@{ x-y.z-w }",
-        result=[(1, "x -y .z -w ")],
+        result=((1, "x -y .z -w "),),
     )
     at_in_the_scalar = LexerTestCase(
         source='"@{ a.b }"',
-        result=[(0, '"'), (1, "a .b "), (0, '"')],
+        result=((0, '"'), (1, "a .b "), (0, '"')),
+    )
+    escaped_expression = LexerTestCase(
+        source="@@{ a.b } @@@{ a.b }",
+        result=((0, "@@{ a.b } @@"), (1, "a .b ")),
+    )
+    at_in_the_expression = LexerTestCase(
+        source="@{ '@{ a }' }!",
+        result=((1, "'@{ a }'"), (0, "!")),
+    )
+    unterminated_expression = LexerTestCase(
+        source="foo @{ a.b",
+        result=((0, "foo @{ a.b"),),
     )
 
 
 @LexerDataSuite.parametrize
-def test_lexer(source: str, result: t.List[t.Tuple[int, str]]) -> None:
+def test_lexer(source: str, result: t.Tuple[t.Tuple[int, str], ...]) -> None:
     """Check lexer result validity"""
-    assert list(TemplarStringLexer(source)) == result
+    assert tuple(TemplarStringLexer(source)) == result
 
 
 def test_tokenizer_eof() -> None:
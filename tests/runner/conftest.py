@@ -2,26 +2,34 @@
 
 # pylint: disable=redefined-outer-name,unused-argument
 
-import base64
+import asyncio
 import textwrap
 import typing as t
 from pathlib import Path
 
-import aiodocker
 import pytest
-import pytest_asyncio
 from _pytest.fixtures import SubRequest
 
 import cjunct
 from cjunct.config.environment import Env
 from cjunct.display.default import DefaultDisplay
-from .types import CtxFactoryType, RunFactoryType
+from .types import CtxFactoryType, RunFactoryType, SourceApplierType
 
 
-@pytest.fixture(scope="session", autouse=True)
-def disable_env_cache() -> None:
+SAMPLES_DIRECTORY: Path = Path(__file__).parent / "samples"
+ACTIONS_CLASS_DEFINITIONS_BASE_PATH: Path = Path(__file__).parent / "extension" / "modules" / "actions"
+ACTIONS_CLASS_DEFINITIONS_DIRECTORIES: str = ",".join(
+    str(ACTIONS_CLASS_DEFINITIONS_BASE_PATH / sub_dir) for sub_dir in ("first", "second")
+)
+
+
+@pytest.fixture
+def disable_env_cache() -> t.Generator[None, None, None]:
     """Do not cache environment variables values for varying tests"""
+    cache_values: bool = Env.cache_values
     Env.cache_values = False
+    yield
+    Env.cache_values = cache_values
 
 
 @pytest.fixture
@@ -29,10 +37,6 @@ def display_collector(monkeypatch: pytest.MonkeyPatch) -> t.List[str]:
     """Creates display events list instead of putting them to stdout"""
     results: t.List[str] = []
 
-    # pylint: disable=unused-argument
-    def display(self, message: str) -> None:
-        results.append(message)
-
     # pylint: disable=unused-argument
     def _run_dialog(
         cls,
@@ -41,7 +45,8 @@ def display_collector(monkeypatch: pytest.MonkeyPatch) -> t.List[str]:
     ) -> t.List[str]:
         return default_selected_action_names[:1]
 
-    monkeypatch.setattr(DefaultDisplay, "display", display)
+    # Bound directly, so that no wrapper frame is pushed for each displayed message
+    monkeypatch.setattr(DefaultDisplay, "display", staticmethod(results.append))
     monkeypatch.setattr(DefaultDisplay, "_run_dialog", _run_dialog)
     return results
 
@@ -53,7 +58,7 @@ def ctx_from_text(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> CtxFactory
     def make(data: str) -> Path:
         actions_source_path: Path = tmp_path / "cjunct.yaml"
         actions_source_path.write_bytes(textwrap.dedent(data).encode())
-        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CJUNCT_CONTEXT_DIRECTORY", str(tmp_path))
         return actions_source_path
 
     return make
@@ -78,81 +83,77 @@ def run_text(
 @pytest.fixture
 def actions_definitions_directory(monkeypatch: pytest.MonkeyPatch) -> None:
     """Add actions definitions from directories"""
-    actions_class_definitions_base_path: Path = Path(__file__).parent / "extension" / "modules" / "actions"
-    monkeypatch.setenv(
-        name="CJUNCT_ACTIONS_CLASS_DEFINITIONS_DIRECTORY",
-        value=",".join(str(actions_class_definitions_base_path / sub_dir) for sub_dir in ("first", "second")),
-    )
+    monkeypatch.setenv(name="CJUNCT_ACTIONS_CLASS_DEFINITIONS_DIRECTORY", value=ACTIONS_CLASS_DEFINITIONS_DIRECTORIES)
+
+
+@pytest.fixture(params=["env_context_dir", "env_workflow"])
+def workflow_source_applier(request: SubRequest, monkeypatch: pytest.MonkeyPatch) -> SourceApplierType:
+    """Point the runner to a directory containing a workflow file in different ways"""
+
+    def apply(directory: Path) -> None:
+        if request.param == "env_context_dir":
+            monkeypatch.setenv("CJUNCT_CONTEXT_DIRECTORY", str(directory))
+        elif request.param == "env_workflow":
+            monkeypatch.setenv("CJUNCT_WORKFLOW_FILE", str(directory / "cjunct.yaml"))
+        else:
+            raise ValueError(request.param)
 
+    return apply
 
-@pytest.fixture(params=["chdir", "env_workflow"])
-def runner_good_context(ctx_from_text: CtxFactoryType, request: SubRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+
+@pytest.fixture
+def runner_good_context(workflow_source_applier: SourceApplierType) -> None:
     """Prepare a directory with good sample workflow files"""
-    actions_source_path: Path = ctx_from_text(
-        """
-        actions:
-          - name: Foo
-            type: shell
-            command: echo "foo"
-          - name: Bar
-            type: shell
-            command: echo "bar" >&2
-            expects:
-              - Foo
-        """
-    )
-    if request.param == "chdir":
-        monkeypatch.chdir(actions_source_path.parent)
-    elif request.param == "env_workflow":
-        monkeypatch.setenv("CJUNCT_WORKFLOW_FILE", str(actions_source_path))
-    else:
-        raise ValueError(request.param)
-
-
-@pytest.fixture(params=["chdir", "env_workflow"])
-def runner_shell_yield_good_context(request: SubRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    workflow_source_applier(SAMPLES_DIRECTORY / "good")
+
+
+@pytest.fixture
+def runner_shell_yield_good_context(workflow_source_applier: SourceApplierType) -> None:
     """Prepare a directory with good sample workflow files using shell yield feature"""
+    workflow_source_applier(SAMPLES_DIRECTORY / "shell-yield")
 
-    def _str_to_b64(s: str) -> str:
-        return base64.b64encode(s.encode()).decode()
-
-    actions_source_path: Path = tmp_path / "cjunct.yaml"
-    actions_source_path.write_bytes(
-        f"""---
-context:
-    bar_prefix: Prefix
-actions:
-  - name: Foo
-    type: shell
-    command: yield_outcome result_key "I am foo" 
-  - name: Bar
-    type: shell
-    command: |
-     echo "@{{outcomes.Foo.result_key}}"
-     echo "@{{context.bar_prefix}} ##cjunct[yield-outcome-b64 {_str_to_b64('result_key')} {_str_to_b64('bar')}]##"
-    expects: Foo
-  - name: Baz
-    type: shell
-    command: echo "@{{outcomes.Bar.result_key}}"
-    expects: Bar
-  - name: Pivoslav
-    type: shell
-    command: skip
-""".encode()
-    )
-    if request.param == "chdir":
-        monkeypatch.chdir(tmp_path)
-    elif request.param == "env_workflow":
-        monkeypatch.setenv("CJUNCT_WORKFLOW_FILE", str(actions_source_path))
-    else:
-        raise ValueError(request.param)
-
-
-@pytest_asyncio.fixture
-async def check_docker() -> None:
-    """Skip if no docker context is available"""
-    try:
+
+@pytest.fixture(scope="session")
+def docker_probe_error() -> t.Optional[Exception]:
+    """Try loading a docker context once per session"""
+    # Docker support is an optional extra, so its client library is imported only when a docker test needs it
+    aiodocker = pytest.importorskip("aiodocker")
+
+    async def probe() -> None:
         async with aiodocker.Docker():
             pass
+
+    try:
+        asyncio.run(probe())
+    except Exception as e:
+        return e
+    return None
+
+
+@pytest.fixture
+def check_docker(docker_probe_error: t.Optional[Exception]) -> None:
+    """Skip if no docker context is available"""
+    if docker_probe_error is not None:
+        pytest.skip(f"Unable to load docker context: {docker_probe_error!r}")
+
+
+@pytest.fixture(scope="session")
+def alpine_image(docker_probe_error: t.Optional[Exception]) -> str:
+    """Make sure the image used by docker tests is present, pulling it once per session if missing locally"""
+    image: str = "alpine:latest"
+    if docker_probe_error is not None:
+        pytest.skip(f"Unable to load docker context: {docker_probe_error!r}")
+    aiodocker = pytest.importorskip("aiodocker")
+
+    async def ensure_image() -> None:
+        async with aiodocker.Docker() as client:
+            try:
+                await client.images.inspect(image)
+            except aiodocker.DockerError:
+                await client.images.pull(image)
+
+    try:
+        asyncio.run(ensure_image())
     except Exception as e:
-        pytest.skip(f"Unable to load docker context: {e!r}")
+        pytest.skip(f"Unable to pull {image}: {e!r}")
+    return image
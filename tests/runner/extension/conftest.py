@@ -1,14 +1,17 @@
 """Extension test fixtures"""
 
+# pylint: disable=redefined-outer-name
+
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def echo_context(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Prepare context dir for external action check"""
-    (tmp_path / "cjunct.yaml").write_bytes(
+@pytest.fixture(scope="session")
+def echo_context_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Context dir for external action check, shared across the session"""
+    directory: Path = tmp_path_factory.mktemp("echo")
+    (directory / "cjunct.yaml").write_bytes(
         b"""---
 actions:
   - name: Foo
@@ -16,26 +19,40 @@ actions:
     message: foo
 """,
     )
-    monkeypatch.chdir(tmp_path)
+    return directory
 
 
 @pytest.fixture
-def string_returning_context(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Prepare context dir for not-None returning action"""
-    (tmp_path / "cjunct.yaml").write_bytes(
+def echo_context(echo_context_directory: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Prepare context dir for external action check"""
+    monkeypatch.chdir(echo_context_directory)
+
+
+@pytest.fixture(scope="session")
+def string_returning_context_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Context dir for not-None returning action, shared across the session"""
+    directory: Path = tmp_path_factory.mktemp("string-returning")
+    (directory / "cjunct.yaml").write_bytes(
         b"""---
 actions:
   - name: Foo
     type: return-string
 """,
     )
-    monkeypatch.chdir(tmp_path)
+    return directory
 
 
 @pytest.fixture
-def context_keys_isolation_context(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Prepare context dir to check that "context" keys are not imported"""
-    (tmp_path / "imported.yaml").write_bytes(
+def string_returning_context(string_returning_context_directory: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Prepare context dir for not-None returning action"""
+    monkeypatch.chdir(string_returning_context_directory)
+
+
+@pytest.fixture(scope="session")
+def context_keys_isolation_context_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Context dir to check that "context" keys are not imported, shared across the session"""
+    directory: Path = tmp_path_factory.mktemp("context-keys-isolation")
+    (directory / "imported.yaml").write_bytes(
         b"""---
 context:
     imported_key: ok
@@ -45,10 +62,19 @@ actions:
     message: "@{context.imported_key}"
 """,
     )
-    (tmp_path / "cjunct.yaml").write_bytes(
+    (directory / "cjunct.yaml").write_bytes(
         b"""---
 actions:
   - !import ./imported.yaml
 """,
     )
-    monkeypatch.chdir(tmp_path)
+    return directory
+
+
+@pytest.fixture
+def context_keys_isolation_context(
+    context_keys_isolation_context_directory: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Prepare context dir to check that "context" keys are not imported"""
+    monkeypatch.chdir(context_keys_isolation_context_directory)
@@ -10,6 +10,8 @@ import pytest
 import cjunct
 from cjunct.exceptions import SourceError, LoadError, ExecutionFailed
 
+pytestmark = pytest.mark.usefixtures("disable_env_cache")
+
 MODULES_DIR: Path = Path(__file__).parent / "modules"
 
 
@@ -12,10 +12,12 @@ import cjunct
 from cjunct import exceptions
 from cjunct.actions.base import ActionStatus
 from cjunct.config.constants import C
-from cjunct.config.environment import Env
+from cjunct.loader.helpers import detect_workflow_source, get_default_loader_class_for_source
 from cjunct.strategy import BaseStrategy
 from .types import RunFactoryType, CtxFactoryType
 
+pytestmark = pytest.mark.usefixtures("disable_env_cache")
+
 
 def test_simple_runner_call(runner_good_context: None) -> None:
     """Check default call"""
@@ -44,32 +46,30 @@ def test_runner_multiple_run(runner_good_context: None) -> None:
 
 def test_not_found_workflow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Empty source directory"""
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CJUNCT_CONTEXT_DIRECTORY", str(tmp_path))
     with pytest.raises(exceptions.SourceError, match="No workflow source detected in"):
-        cjunct.Runner().run_sync()
+        detect_workflow_source()
 
 
 def test_multiple_found_workflows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Ambiguous source directory"""
-    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CJUNCT_CONTEXT_DIRECTORY", str(tmp_path))
     (tmp_path / "cjunct.yml").touch()
     (tmp_path / "cjunct.yaml").touch()
     with pytest.raises(exceptions.SourceError, match="Multiple workflow sources detected in"):
-        cjunct.Runner().run_sync()
+        detect_workflow_source()
 
 
-def test_non_existent_workflow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_non_existent_workflow(tmp_path: Path) -> None:
     """No workflow file with given name"""
-    monkeypatch.chdir(tmp_path)
     with pytest.raises(exceptions.LoadError, match="Workflow file not found"):
         cjunct.Runner(source=tmp_path / "cjunct.yml").run_sync()
 
 
-def test_unrecognized_workflow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_unrecognized_workflow(tmp_path: Path) -> None:
     """Unknown workflow file format"""
-    monkeypatch.chdir(tmp_path)
     with pytest.raises(exceptions.SourceError, match="Unrecognized source"):
-        cjunct.Runner(source=tmp_path / "wf.foo").run_sync()
+        get_default_loader_class_for_source(tmp_path / "wf.foo")
 
 
 @pytest.mark.parametrize(
@@ -86,11 +86,9 @@ def test_strategy_runner_call(
     runner_good_context: None,
     strategy_class: t.Type[BaseStrategy],
     display_collector: t.List[str],
-    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Check all strategies"""
-    monkeypatch.setattr(Env, "CJUNCT_STRATEGY_NAME", strategy_class.NAME)
-    cjunct.Runner().run_sync()
+    cjunct.Runner(strategy_class=strategy_class).run_sync()
     assert set(display_collector) == {
         "[Foo]  | foo",
         "[Bar] *| bar",
@@ -167,7 +165,7 @@ def test_invalid_action_source_file_via_env(tmp_path: Path, monkeypatch: pytest.
     """Check raising SourceError for absent file via CJUNCT_WORKFLOW_FILE"""
     monkeypatch.setenv("CJUNCT_WORKFLOW_FILE", str(tmp_path / "missing.yaml"))
     with pytest.raises(exceptions.SourceError, match="Given workflow file does not exist"):
-        cjunct.Runner().run_sync()
+        detect_workflow_source()
 
 
 def test_status_good_substitution(run_text: RunFactoryType) -> None:
@@ -190,8 +188,8 @@ def test_status_bad_substitution(run_text: RunFactoryType) -> None:
             """
             actions:
               - name: Foo
-                type: shell
-                command: echo "@{status.too.may.parts}"
+                type: echo
+                message: "@{status.too.may.parts}"
             """
         )
 
@@ -213,9 +211,29 @@ actions:
     cjunct.Runner().run_sync()
 
 
+def test_stream_feed(display_collector: t.List[str]) -> None:
+    """Check actions fed from an in-memory stream directly"""
+    cjunct.Runner(
+        source=io.StringIO(
+            """---
+actions:
+  - name: Foo
+    type: echo
+    message: foo
+"""
+        )
+    ).run_sync()
+    assert display_collector == [
+        "[Foo]  | foo",
+        "============",
+        "SUCCESS: Foo",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_docker_good_context(
     check_docker: None,
+    alpine_image: str,
     ctx_from_text: CtxFactoryType,
     tmp_path: Path,
     display_collector: t.List[str],
@@ -228,7 +246,7 @@ async def test_docker_good_context(
             actions:
               - type: docker-shell
                 name: Foo
-                image: alpine:latest
+                image: {alpine_image}
                 command: |
                   cat /tmp/bind_file.txt
                   printf "-"
@@ -252,15 +270,16 @@ async def test_docker_good_context(
 @pytest.mark.asyncio
 async def test_docker_bad_context(
     check_docker: None,
+    alpine_image: str,
     ctx_from_text: CtxFactoryType,
 ) -> None:
     """Check docker shell action step failure"""
     ctx_from_text(
-        """
+        f"""
         actions:
           - type: docker-shell
             name: Foo
-            image: alpine:latest
+            image: {alpine_image}
             command: no-such-command
         """
     )
@@ -508,14 +527,14 @@ def test_implicit_naming(run_text: RunFactoryType) -> None:
         """
         ---
         actions:
-          - type: shell
-            command: echo Foo
+          - type: echo
+            message: Foo
         """
     )
     assert output == [
-        "[shell-0]  | Foo",
-        "================",
-        "SUCCESS: shell-0",
+        "[echo-0]  | Foo",
+        "===============",
+        "SUCCESS: echo-0",
     ]
 
 
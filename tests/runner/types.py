@@ -6,7 +6,9 @@ from pathlib import Path
 __all__ = [
     "CtxFactoryType",
     "RunFactoryType",
+    "SourceApplierType",
 ]
 
 CtxFactoryType = t.Callable[[str], Path]
 RunFactoryType = t.Callable[[str], t.List[str]]
+SourceApplierType = t.Callable[[Path], None]
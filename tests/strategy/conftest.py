@@ -67,3 +67,79 @@ def strict_skipping_workflow() -> Workflow:
             self.skip()
 
     return _make_chained_workflow(action_class=SkippingAction)
+
+
+def _make_workflow(dependencies: t.Dict[str, t.Dict[str, bool]], failing: t.Collection[str] = ()) -> Workflow:
+    """Build a workflow from a map of action names to their ancestors' strictness, keeping the given order"""
+
+    class MaybeFailingAction(ActionBase):
+        """Raises RuntimeError if told to"""
+
+        async def run(self) -> None:
+            if self.name in failing:
+                raise RuntimeError
+
+    return Workflow(
+        {
+            name: MaybeFailingAction(
+                name=name,
+                ancestors={
+                    ancestor_name: ActionDependency(strict=strict) for ancestor_name, strict in ancestors.items()
+                },
+            )
+            for name, ancestors in dependencies.items()
+        }
+    )
+
+
+@pytest.fixture
+def fan_in_workflow() -> Workflow:
+    """Independent actions joined by a single one"""
+    return _make_workflow(
+        {
+            "foo": {},
+            "bar": {},
+            "baz": {},
+            "qux": {"foo": False, "bar": False, "baz": False},
+        }
+    )
+
+
+@pytest.fixture
+def diamond_workflow() -> Workflow:
+    """An action forking into two branches, which join afterwards"""
+    return _make_workflow(
+        {
+            "foo": {},
+            "bar": {"foo": False},
+            "baz": {"foo": False},
+            "qux": {"bar": False, "baz": False},
+        }
+    )
+
+
+@pytest.fixture
+def failed_ancestor_workflow() -> Workflow:
+    """A failing action followed by both loosely and strictly dependent ones"""
+    return _make_workflow(
+        {
+            "foo": {},
+            "bar": {"foo": False},
+            "baz": {"foo": True},
+            "qux": {"baz": False},
+        },
+        failing={"foo"},
+    )
+
+
+@pytest.fixture
+def simultaneously_ready_workflow() -> Workflow:
+    """Several actions released by the same one, declared in non-alphabetical order"""
+    return _make_workflow(
+        {
+            "foo": {},
+            "qux": {"foo": False},
+            "bar": {"foo": False},
+            "baz": {"foo": False},
+        }
+    )
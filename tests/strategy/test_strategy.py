@@ -1,5 +1,6 @@
 """Common strategy tests"""
 
+import asyncio
 import collections
 import typing as t
 
@@ -11,6 +12,19 @@ from cjunct.strategy import BaseStrategy
 from cjunct.workflow import Workflow
 
 
+async def _run_concurrently(strategy: BaseStrategy, workflow: Workflow) -> t.List[str]:
+    """Run emitted actions in parallel the way the runner does, returning emitted names in order"""
+    emitted_names: t.List[str] = []
+    running_actions: t.List[asyncio.Future] = []
+    async for action in strategy:  # type: ActionBase
+        assert all(workflow[ancestor_name].done() for ancestor_name in action.ancestors)
+        emitted_names.append(action.name)
+        if action.enabled:
+            running_actions.append(asyncio.ensure_future(action))
+    await asyncio.gather(*running_actions, return_exceptions=True)
+    return emitted_names
+
+
 @pytest.mark.asyncio
 async def test_chain_success(strict_successful_workflow: Workflow) -> None:
     """Chain successful execution"""
@@ -56,6 +70,68 @@ async def test_chain_skip(strict_skipping_workflow: Workflow) -> None:
     assert all(a.status == ActionStatus.SKIPPED for a in strict_skipping_workflow.values())
 
 
+@pytest.mark.asyncio
+async def test_fan_in(fan_in_workflow: Workflow) -> None:
+    """Joining action is emitted only after all of its ancestors are done"""
+    assert await _run_concurrently(LooseStrategy(fan_in_workflow), fan_in_workflow) == ["foo", "bar", "baz", "qux"]
+    assert all(action.status == ActionStatus.SUCCESS for action in fan_in_workflow.values())
+
+
+@pytest.mark.asyncio
+async def test_diamond(diamond_workflow: Workflow) -> None:
+    """Both branches are released by the same action and joined afterwards"""
+    assert await _run_concurrently(LooseStrategy(diamond_workflow), diamond_workflow) == ["foo", "bar", "baz", "qux"]
+    assert all(action.status == ActionStatus.SUCCESS for action in diamond_workflow.values())
+
+
+@pytest.mark.asyncio
+async def test_non_strict_dependency_on_failure(failed_ancestor_workflow: Workflow) -> None:
+    """Loose dependencies do not care about the ancestor outcome, strict ones do"""
+    emitted_names: t.List[str] = await _run_concurrently(
+        LooseStrategy(failed_ancestor_workflow),
+        failed_ancestor_workflow,
+    )
+    assert emitted_names == ["foo", "bar", "qux"]
+    assert {name: action.status for name, action in failed_ancestor_workflow.items()} == {
+        "foo": ActionStatus.FAILURE,
+        "bar": ActionStatus.SUCCESS,
+        "baz": ActionStatus.SKIPPED,
+        "qux": ActionStatus.SUCCESS,
+    }
+
+
+@pytest.mark.asyncio
+async def test_simultaneously_ready_emission_order(simultaneously_ready_workflow: Workflow) -> None:
+    """Actions becoming ready at once are emitted in the workflow order"""
+    emitted_names: t.List[str] = await _run_concurrently(
+        LooseStrategy(simultaneously_ready_workflow),
+        simultaneously_ready_workflow,
+    )
+    assert emitted_names == ["foo", "qux", "bar", "baz"]
+
+
+@pytest.mark.asyncio
+async def test_omitted_beforehand(strict_successful_workflow: Workflow) -> None:
+    """Actions disabled before the strategy is constructed release their descendants"""
+    strict_successful_workflow["foo"].disable()
+    strict_successful_workflow["baz"].disable()
+    emitted_names: t.List[str] = await _run_concurrently(
+        LooseStrategy(strict_successful_workflow),
+        strict_successful_workflow,
+    )
+    # "qux" has been released by the omitted "baz" at once, so it does not wait for "bar" to finish
+    assert emitted_names[:3] == ["foo", "bar", "qux"]
+    assert sorted(emitted_names) == sorted(strict_successful_workflow)
+    assert {name: action.status for name, action in strict_successful_workflow.items()} == {
+        "foo": ActionStatus.OMITTED,
+        "bar": ActionStatus.SUCCESS,
+        "baz": ActionStatus.OMITTED,
+        "qux": ActionStatus.SUCCESS,
+        "fred": ActionStatus.SUCCESS,
+        "thud": ActionStatus.SUCCESS,
+    }
+
+
 def test_non_redefined_name() -> None:
     """Check strategy name collision"""
     with pytest.raises(NameError, match="Strategy named 'loose' already exists"):
@@ -0,0 +1,26 @@
+"""Workflow structure tests"""
+
+from cjunct.actions.base import ActionBase, ActionDependency
+from cjunct.workflow import Workflow
+
+
+class NoopAction(ActionBase):
+    """Does nothing"""
+
+    async def run(self) -> None:
+        pass
+
+
+def test_descendants_names() -> None:
+    """Only direct descendants are reported, in the workflow order"""
+    workflow: Workflow = Workflow(
+        {
+            "foo": NoopAction(name="foo"),
+            "bar": NoopAction(name="bar", ancestors={"foo": ActionDependency()}),
+            "baz": NoopAction(name="baz", ancestors={"foo": ActionDependency(strict=True)}),
+            "qux": NoopAction(name="qux", ancestors={"bar": ActionDependency(), "baz": ActionDependency()}),
+        }
+    )
+    assert list(workflow.get_descendants_names("foo")) == ["bar", "baz"]
+    assert list(workflow.get_descendants_names("bar")) == ["qux"]
+    assert not workflow.get_descendants_names("qux")